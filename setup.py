@@ -18,5 +18,7 @@ setup(
     keywords='Ticketmaster',
     url='https://github.com/arcward/ticketpy',
     packages=['ticketpy'],
-    install_requires=['requests']
+    python_requires='>=3.6',
+    install_requires=['requests'],
+    extras_require={'fast-json': ['orjson>=3']}
 )
\ No newline at end of file
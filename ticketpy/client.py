@@ -1,7 +1,11 @@
 """API client classes"""
 import logging
-import requests
-from collections import namedtuple
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from collections import deque, namedtuple, OrderedDict
 from urllib import parse
 from ticketpy.query import (
     AttractionQuery,
@@ -11,13 +15,205 @@ from ticketpy.query import (
 )
 from ticketpy.model import Page
 
+# Prefer a C JSON parser when one is installed (fastest first)
+try:
+    from orjson import loads as _loads
+except ImportError:
+    try:
+        from ujson import loads as _loads
+    except ImportError:
+        from json import loads as _loads
+
+#: Entry in an API response's *errors* list
+_Error = namedtuple('Error', ['code', 'detail', 'href'])
+#: Link split into its base URL and dict of query parameters
+_Link = namedtuple('Link', ['url', 'params'])
+#: Interned copies of parameter names that show up in most page links
+_PARAM_NAMES = {k: sys.intern(k) for k in (
+    'apikey', 'size', 'page', 'sort', 'countryCode', 'stateCode', 'city',
+    'latlong', 'radius', 'includeTBA', 'includeTBD', 'includeTest', 'keyword'
+)}
+
+#: Normalized values for parameters expecting ['yes', 'no', 'only'],
+#: keyed on both the lowercase strings and the values usually passed as-is
+_YES_NO_MAP = {
+    'true': 'yes', 'yes': 'yes', 'false': 'no', 'no': 'no', 'only': 'only',
+    True: 'yes', False: 'no', 'True': 'yes', 'False': 'no'
+}
+
+
+def _yes_no_only(s):
+    """Helper for parameters expecting ['yes', 'no', 'only']"""
+    # Only look up bools and strings as-is: 1 == True would map to 'yes',
+    # and unhashable values can't be looked up at all
+    if type(s) in (bool, str):
+        r = _YES_NO_MAP.get(s)
+        if r is not None:
+            return r
+    s = str(s).lower()
+    return _YES_NO_MAP.get(s, s)
+
+
+#: Converts search parameter values to the form the API expects.
+#: Ex: 'includeTBA' might be passed as bool(True) instead of 'yes'
+#: and 'radius' might be passed as int(2) instead of '2'
+_PARAM_CONVERTERS = {
+    'includeTBA': _yes_no_only,
+    'includeTBD': _yes_no_only,
+    'includeTest': _yes_no_only,
+    'size': str,
+    'radius': str,
+    'marketId': str
+}
+
+#: The API rejects page requests deeper than this (page * size)
+_MAX_PAGING_DEPTH = 1000
+
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
-sh = logging.StreamHandler()
-sh.setLevel(logging.INFO)
-sf = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-sh.setFormatter(sf)
-log.addHandler(sh)
+
+
+def configure_logging(level=logging.INFO):
+    """Attaches a stream handler to this module's logger.
+
+    No handler is added on import, so log output is up to the
+    application unless this is called.
+
+    :param level: Logging level for the logger and handler
+    """
+    sh = logging.StreamHandler()
+    sh.setLevel(level)
+    sf = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    sh.setFormatter(sf)
+    log.setLevel(level)
+    log.addHandler(sh)
+
+
+def _new_session():
+    """Returns a ``requests.Session`` with connection pooling and retries"""
+    # requests/urllib3 are imported here rather than at module level so
+    # that importing ticketpy stays cheap until a client is created
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    # Once retries run out, return the last response instead of raising
+    # RetryError so it still becomes an ApiException with the API's details
+    retries = Retry(total=3, backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                          max_retries=retries)
+    session.mount('https://', adapter)
+    return session
+
+
+def _is_transient(error):
+    """True if ``error`` is a connection failure/timeout or a 429/5xx
+    response"""
+    # Other RequestExceptions (invalid URLs, too many redirects...) would
+    # fail again, so they aren't covered up with a stale response
+    from requests.exceptions import ConnectionError, Timeout
+    if isinstance(error, (ConnectionError, Timeout)):
+        return True
+    if isinstance(error, ApiException) and error.args:
+        status_code = error.args[0]
+        return status_code == 429 or (isinstance(status_code, int)
+                                      and status_code >= 500)
+    return False
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache of raw response bodies, with an optional TTL.
+
+    Expired responses are kept until evicted so they can still be served
+    by ``fetch(..., fallback=True)`` if a new request fails.
+    """
+    __slots__ = ('maxsize', 'ttl', 'hits', 'misses', '_data', '_lock',
+                 '_key_locks')
+
+    def __init__(self, maxsize, ttl=None):
+        """
+        :param maxsize: Max number of responses to keep
+        :param ttl: Seconds a response stays valid (``None`` = no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def fetch(self, key, request, fallback=False):
+        """Returns the cached body for ``key``, or calls ``request()``
+        for a ``(body, cacheable)`` tuple and caches the body if allowed.
+
+        Concurrent fetches of the same key wait for the first one to
+        finish instead of each making the request.
+
+        :param fallback: If ``request()`` fails with a connection error or
+            429/5xx response, return an expired body for ``key`` (if there
+            is one) instead of raising
+        """
+        body = self.__lookup(key, count_miss=False)
+        if body is not None:
+            return body
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have cached it while we were waiting
+            body = self.__lookup(key, count_miss=True)
+            if body is not None:
+                return body
+            try:
+                body, cacheable = request()
+                if cacheable:
+                    self.__store(key, body)
+            except Exception as e:
+                stale = self.__stale(key) if fallback else None
+                if stale is None or not _is_transient(e):
+                    raise
+                log.warning("Request failed (%r), using stale response", e)
+                return stale
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        return body
+
+    def clear(self):
+        """Discards all cached responses"""
+        with self._lock:
+            self._data.clear()
+
+    def __lookup(self, key, count_miss):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires, body = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return body
+            if count_miss:
+                self.misses += 1
+            return None
+
+    def __stale(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[1] if entry is not None else None
+
+    def __store(self, key, body):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires, body)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
 
 
 class ApiClient:
@@ -29,7 +225,7 @@ class ApiClient:
     .. code-block:: python
     
         import ticketpy
-        
+
         client = ticketpy.ApiClient("your_api_key")
         resp = client.venues.find(keyword="Tabernacle").one()
         for venue in resp:
@@ -47,93 +243,214 @@ class ApiClient:
     Request URLs end up looking like:
     http://app.ticketmaster.com/discovery/v2/events.json?apikey={api_key}
     """
+    __slots__ = (
+        '__api_key', '_endpoints', '_session', '_page_cache', '_search_cache',
+        '_cache_fallback'
+    )
     root_url = 'https://app.ticketmaster.com'
     url = 'https://app.ticketmaster.com/discovery/v2'
+    #: Search methods available through ``search()``
+    methods = ('events', 'venues', 'attractions', 'classifications')
+    #: Max number of raw page responses cached by ``get_url()``
+    page_cache_size = 128
+    #: Seconds a cached page response is considered fresh
+    page_cache_ttl = 300
+    #: Max number of first-page responses cached by ``search()``
+    search_cache_size = 256
+    #: Keep each model's source JSON as its ``json`` attribute. Off by
+    #: default since it keeps every parsed response alive alongside the
+    #: models built from it; when off, ``json`` is ``None``.
+    keep_raw_json = False
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache_ttl=30, cache_fallback=False):
+        """
+        :param api_key: Discovery API key
+        :param cache_ttl: Seconds to reuse the response of an identical
+            ``search()`` call (``None`` or 0 to disable)
+        :param cache_fallback: Serve an expired cached response instead of
+            raising when the API fails with a transient error (429/5xx, a
+            connection error or a timeout)
+        """
         self.__api_key = None
+        self._endpoints = None
         self.api_key = api_key
-        self.events = EventQuery(api_client=self)
-        self.venues = VenueQuery(api_client=self)
-        self.attractions = AttractionQuery(api_client=self)
-        self.classifications = ClassificationQuery(api_client=self)
-        self.segment_by_id = self.classifications.segment_by_id
-        self.genre_by_id = self.classifications.genre_by_id
-        self.subgenre_by_id = self.classifications.subgenre_by_id
+        # Shared session so paged requests reuse one keep-alive connection
+        # instead of a new TCP/TLS handshake per request
+        self._session = _new_session()
+        # Raw bodies of pages fetched by get_url(), keyed by link, and
+        # first pages returned by search(), keyed by method/params
+        self._page_cache = _ResponseCache(self.page_cache_size,
+                                          ttl=self.page_cache_ttl)
+        self._search_cache = None
+        if cache_ttl:
+            self._search_cache = _ResponseCache(self.search_cache_size,
+                                                ttl=cache_ttl)
+        self._cache_fallback = cache_fallback
+
+        log.debug("Root URL: %s", self.url)
+
+    # Queries are built on access rather than stored, since each one
+    # references the client. Storing them would create a reference cycle
+    # that keeps the client (and its session) alive until a GC pass.
+    @property
+    def events(self):
+        """``EventQuery`` for searching events"""
+        return EventQuery(api_client=self)
+
+    @property
+    def venues(self):
+        """``VenueQuery`` for searching venues"""
+        return VenueQuery(api_client=self)
+
+    @property
+    def attractions(self):
+        """``AttractionQuery`` for searching attractions"""
+        return AttractionQuery(api_client=self)
+
+    @property
+    def classifications(self):
+        """``ClassificationQuery`` for searching classifications"""
+        return ClassificationQuery(api_client=self)
+
+    def segment_by_id(self, segment_id):
+        """Return a ``Segment`` matching this ID"""
+        return self.classifications.segment_by_id(segment_id)
+
+    def genre_by_id(self, genre_id):
+        """Return a ``Genre`` matching this ID"""
+        return self.classifications.genre_by_id(genre_id)
+
+    def subgenre_by_id(self, subgenre_id):
+        """Return a ``SubGenre`` matching this ID"""
+        return self.classifications.subgenre_by_id(subgenre_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-        log.debug("Root URL: {}".format(self.url))
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections"""
+        self._session.close()
+
+    def get_session(self):
+        """Returns the ``requests.Session`` used for all API requests.
+
+        Mount adapters or set headers/auth on it to customize retries,
+        proxies and the like for every request this client makes.
+        """
+        return self._session
+
+    def clear_page_cache(self):
+        """Discards page responses cached by ``get_url()``"""
+        self._page_cache.clear()
+
+    def clear_cache(self):
+        """Discards all cached ``search()`` and ``get_url()`` responses"""
+        self._page_cache.clear()
+        if self._search_cache is not None:
+            self._search_cache.clear()
+
+    def cache_stats(self):
+        """Returns a dict of response cache *hits* and *misses*"""
+        caches = [self._page_cache, self._search_cache]
+        caches = [c for c in caches if c is not None]
+        return {
+            'hits': sum(c.hits for c in caches),
+            'misses': sum(c.misses for c in caches)
+        }
 
     def search(self, method, **kwargs):
         """Generic API request
-        
+
         :param method: Search type (*events*, *venues*...)
         :param kwargs: Search parameters (*venueId*, *eventId*, 
             *latlong*, etc...)
         :return: ``PagedResponse``
         """
-        # Remove unfilled parameters, add apikey header.
-        # Clean up values that might be passed in multiple ways.
-        # Ex: 'includeTBA' might be passed as bool(True) instead of 'yes'
-        # and 'radius' might be passed as int(2) instead of '2'
-        kwargs = {k: v for (k, v) in kwargs.items() if v is not None}
-        updates = self.api_key
-
+        # Remove unfilled parameters and clean up values that might be
+        # passed in multiple ways. The apikey is already part of the
+        # endpoint URL.
+        params = {}
         for k, v in kwargs.items():
-            if k in ['includeTBA', 'includeTBD', 'includeTest']:
-                updates[k] = self.__yes_no_only(v)
-            elif k in ['size', 'radius', 'marketId']:
-                updates[k] = str(v)
-        kwargs.update(updates)
-        log.debug(kwargs)
-        urls = {
-            'events': self.__method_url('events'),
-            'venues': self.__method_url('venues'),
-            'attractions': self.__method_url('attractions'),
-            'classifications': self.__method_url('classifications')
-        }
-        resp = requests.get(urls[method], params=kwargs)
-        return PagedResponse(self, self._handle_response(resp))
+            if v is not None:
+                convert = _PARAM_CONVERTERS.get(k)
+                params[k] = convert(v) if convert else v
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Search params: %s", params)
+        try:
+            url = self._endpoints[method]
+        except KeyError:
+            raise KeyError(f"Unknown search method {method!r} "
+                           f"(expected one of {self.methods})") from None
+        key = None
+        if self._search_cache is not None:
+            try:
+                key = (method, frozenset(params.items()))
+            except TypeError:
+                pass  # Unhashable values (ex: lists), don't cache
+        content = self.__get(self._search_cache, key, url, params)
+        return PagedResponse(self, _loads(content))
+
+    def __get(self, cache, key, url, params):
+        """Makes a GET request, returning the raw response body.
+
+        Returns the body cached under ``key`` if ``cache`` has it, and
+        caches new responses unless they're marked *no-store*. Raises
+        ``ApiException`` for error responses.
+        """
+        def request():
+            resp = self._session.get(url, params=params)
+            if resp.status_code != 200:
+                self._handle_response(resp)
+            cache_control = resp.headers.get('Cache-Control', '')
+            return resp.content, 'no-store' not in cache_control
+
+        if cache is None or key is None:
+            return request()[0]
+        return cache.fetch(key, request, fallback=self._cache_fallback)
 
     def _handle_response(self, response):
         """Raises ``ApiException`` if needed, or returns response JSON obj
-        
+
         Status codes
          * 401 = Invalid API key or rate limit quota violation
          * 400 = Invalid URL parameter
         """
         if response.status_code == 200:
             return self.__success(response)
-        elif response.status_code == 401:
-            self.__fault(response)
-        elif response.status_code == 400:
-            self.__error(response)
-        else:
-            self.__unknown_error(response)
+        # Parse the error body once, then hand it to the handler for
+        # this status code (which raises ``ApiException``)
+        try:
+            rj = _loads(response.content)
+        except ValueError:
+            raise ApiException(response.status_code, response.text)
+        handler = self._error_handlers.get(response.status_code,
+                                           self.__unknown_error)
+        handler(response, rj)
 
     @staticmethod
     def __success(response):
         """Successful response, just return JSON"""
-        return response.json()
+        return _loads(response.content)
 
     @staticmethod
-    def __error(response):
+    def __error(response, rj):
         """HTTP status code 400, or something with 'errors' object"""
-        rj = response.json()
-        error = namedtuple('error', ['code', 'detail', 'href'])
         errors = [
-            error(err['code'], err['detail'], err['_links']['about']['href'])
+            _Error(err['code'], err['detail'], err['_links']['about']['href'])
             for err in rj['errors']
         ]
-        log.error('URL: {}\nErrors: {}'.format(response.url, errors))
+        log.error('URL: %s\nErrors: %s', response.url, errors)
         raise ApiException(response.status_code, errors, response.url)
 
     @staticmethod
-    def __fault(response):
+    def __fault(response, rj):
         """HTTP status code 401, or something with 'faults' object"""
-        rj = response.json()
         fault_str = rj['fault']['faultstring']
         detail = rj['fault']['detail']
-        log.error('URL: {}, Faultstr: {}'.format(response.url, fault_str))
+        log.error('URL: %s, Faultstr: %s', response.url, fault_str)
         raise ApiException(
             response.status_code,
             fault_str,
@@ -141,64 +458,85 @@ class ApiClient:
             response.url
         )
 
-    def __unknown_error(self, response):
+    @staticmethod
+    def __unknown_error(response, rj):
         """Unexpected HTTP status code (not 200, 400, or 401)"""
-        rj = response.json()
         if 'fault' in rj:
-            self.__fault(response)
+            ApiClient.__fault(response, rj)
         elif 'errors' in rj:
-            self.__error(response)
+            ApiClient.__error(response, rj)
         else:
             raise ApiException(response.status_code, response.text)
 
+    #: Maps HTTP status codes to the handler for their error body
+    _error_handlers = {400: __error.__func__, 401: __fault.__func__}
+
     def get_url(self, link):
-        """Gets a specific href from '_links' object in a response"""
+        """Gets a specific href from '_links' object in a response
+
+        Response bodies are cached per link (up to ``page_cache_size``), so
+        requesting the same page again, such as when iterating a
+        ``PagedResponse`` twice, doesn't make another API request. Use
+        ``clear_page_cache()`` to discard them.
+        """
         # API sometimes return incorrectly-formatted strings, need
         # to parse out parameters and pass them into a new request
-        # rather than implicitly trusting the href in _links
-        link = self._parse_link(link)
-        resp = requests.get(link.url, link.params)
-        return Page.from_json(self._handle_response(resp))
+        # rather than implicitly trusting the href in _links. Clean
+        # links without a key of their own can be requested as-is.
+        if '{' in link or 'apikey=' in link:
+            url, params = self._parse_link(link)
+        else:
+            url, params = link, self.__api_key
+        # Cache raw bytes rather than the Page, which callers may mutate
+        content = self.__get(self._page_cache, link, url, params)
+        return Page.from_json(_loads(content))
 
     def _parse_link(self, link):
         """Parses link into base URL and dict of parameters"""
-        parsed_link = namedtuple('link', ['url', 'params'])
-        link_url, link_params = link.split('?')
+        link_url, _, link_params = link.partition('?')
         params = self._link_params(link_params)
-        return parsed_link(link_url, params)
+        return _Link(link_url, params)
 
     def _link_params(self, param_str):
         """Parse URL parameters from href split on '?' character"""
-        search_params = {}
-        params = parse.parse_qs(param_str)
-        for k, v in params.items():
-            search_params[k] = v[0]
-        search_params.update(self.api_key)
+        search_params = {_PARAM_NAMES.get(k, k): v
+                         for (k, v) in parse.parse_qsl(param_str)}
+        search_params['apikey'] = self.__api_key['apikey']
         return search_params
 
     @property
     def api_key(self):
+        """Request params holding the API key (``{'apikey': key}``).
+
+        The same dict is returned on every access, so don't mutate it;
+        assign a new key to this property instead.
+        """
         return self.__api_key
 
     @api_key.setter
     def api_key(self, api_key):
-        # Set this way by default to pass in request params
-        self.__api_key = {'apikey': api_key}
+        # Set this way by default to pass in request params, updated in
+        # place so references to the dict see the new key
+        if self.__api_key is None:
+            self.__api_key = {}
+        elif self.__api_key.get('apikey') != api_key:
+            # Cached responses aren't keyed on the API key, so drop the
+            # ones fetched with the old key
+            self.clear_cache()
+        self.__api_key['apikey'] = api_key
+        # Search URLs carry the encoded key, so searches only need to
+        # encode their own parameters
+        key_query = parse.urlencode(self.__api_key)
+        self._endpoints = {
+            m: f"{self.__method_url(m)}?{key_query}" for m in self.methods
+        }
 
     @staticmethod
     def __method_url(method):
         """Formats a search method URL"""
-        return "{}/{}.json".format(ApiClient.url, method)
+        return f"{ApiClient.url}/{method}.json"
 
-    @staticmethod
-    def __yes_no_only(s):
-        """Helper for parameters expecting ['yes', 'no', 'only']"""
-        s = str(s).lower()
-        if s in ['true', 'yes']:
-            s = 'yes'
-        elif s in ['false', 'no']:
-            s = 'no'
-        return s
+    __yes_no_only = staticmethod(_yes_no_only)
 
 
 class ApiException(Exception):
@@ -209,14 +547,19 @@ class ApiException(Exception):
 
 class PagedResponse:
     """Iterates through API response pages"""
+    __slots__ = ('api_client', 'page', '_executor')
+
     def __init__(self, api_client, response):
         self.api_client = api_client
         self.page = None
         self.page = Page.from_json(response)
+        # Single worker that fetches the next page while the current one
+        # is being consumed, created on first use
+        self._executor = None
 
     def limit(self, max_pages=5):
         """Retrieve X number of pages, returning a ``list`` of all entities.
-        
+
         Rather than iterating through ``PagedResponse`` to retrieve 
         each page (and its events/venues/etc), ``limit()``  will 
         automatically iterate up to ``max_pages`` and return 
@@ -226,17 +569,14 @@ class PagedResponse:
         :return: Flat list of results from pages
         """
         all_items = []
-        counter = 0
-        for pg in self:
-            if counter >= max_pages:
-                break
-            counter += 1
-            all_items += pg
+        # Stops without prefetching the page after the last one
+        for pg in self.iter_pages(max_pages=max_pages):
+            all_items.extend(pg)
         return all_items
 
     def one(self):
         """Get items from first page result"""
-        return [i for i in self.page]
+        return list(self.page)
 
     def maximum(self):
         """Retrieves **maximum** pages in a result, returning a flat list.
@@ -244,25 +584,148 @@ class PagedResponse:
 
         Use ``limit()`` to restrict the number of page requests being made.
         **WARNING**: Generic searches may involve *a lot* of pages...
-        
+
         :return: Flat list of results
         """
-        max_pages = 49 # do not exceed allowed paging depth
-        all_items = []
-        counter = 0
-        for pg in self:
-            if counter >= max_pages:
-                break
-            counter += 1
-            all_items += pg
-        return all_items
+        return self.limit(max_pages=49)  # do not exceed allowed paging depth
 
-    def __iter__(self):
-        yield self.page
-        next_url = self.page.links.get('next')
-        while next_url:
-            log.debug("Requesting page: {}".format(next_url))
-            pg = self.api_client.get_url(next_url)
+    def all(self, max_workers=4):
+        """Retrieves **every** page in a result, returning a flat list.
+
+        Unlike ``maximum()``, this requests every remaining page up to the
+        first page's *totalPages*, or as deep as the API allows paging
+        (*page* * *size* < 1000). Since the page count is known up front,
+        pages are requested concurrently (``max_workers`` at a time) rather
+        than by following each *next* link in turn. **WARNING**: Generic
+        searches may involve *a lot* of pages...
+
+        :param max_workers: Max number of concurrent page requests
+        :return: Flat list of results
+        """
+        links = self.__page_links()
+        if links is None:
+            return list(chain.from_iterable(self))
+        pages = [self.page]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages += executor.map(self.api_client.get_url, links)
+        return list(chain.from_iterable(pages))
+
+    async def aiter_pages(self, concurrency=4):
+        """Asynchronously iterates through pages (``async for``).
+
+        Requests run in a thread pool so the event loop isn't blocked, with
+        up to ``concurrency`` pages requested ahead of the one being
+        consumed. Pages are yielded in order.
+
+        :param concurrency: Max number of concurrent page requests
+        """
+        import asyncio
+        # get_running_loop() is 3.7+; get_event_loop() returns the same
+        # loop from inside a coroutine on 3.6
+        loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)()
+        get_url = self.api_client.get_url
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque()
+        try:
+            yield self.page
+            links = self.__page_links()
+            if links is None:
+                # No page count to work from, follow 'next' links instead
+                next_url = self.page.links.get('next')
+                while next_url:
+                    pg = await loop.run_in_executor(executor, get_url,
+                                                    next_url)
+                    next_url = pg.links.get('next')
+                    yield pg
+                return
+            links = iter(links)
+            for link in islice(links, concurrency):
+                pending.append(loop.run_in_executor(executor, get_url, link))
+            while pending:
+                pg = await pending.popleft()
+                for link in islice(links, 1):
+                    pending.append(
+                        loop.run_in_executor(executor, get_url, link)
+                    )
+                yield pg
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def __page_links(self):
+        """Builds links for every page after the first, or returns ``None``
+        if the first page doesn't include enough info to do so"""
+        # The 'next' link carries the full search, so only its page
+        # number needs changing
+        pg = self.page
+        next_link = pg.links.get('next')
+        if not next_link:
+            return []
+        if ('?' not in next_link or pg.number is None or not pg.total_pages
+                or not pg.size):
+            return None
+        link_url, _, link_params = next_link.partition('?')
+        params = dict(parse.parse_qsl(link_params))
+        # Pages past the API's paging depth would only return errors; the
+        # last one allowed is the highest with page * size < 1000
+        page_limit = (_MAX_PAGING_DEPTH - 1) // pg.size + 1
+        links = []
+        for number in range(pg.number + 1, min(pg.total_pages, page_limit)):
+            params['page'] = number
+            links.append(f"{link_url}?{parse.urlencode(params)}")
+        return links
+
+    def iter_pages(self, prefetch=True, max_pages=None):
+        """Iterates through response pages (same as iterating over this
+        ``PagedResponse``)
+
+        :param prefetch: Request the next page in the background while the
+            current one is being consumed
+        :param max_pages: Stop after this many pages, without requesting
+            the one after the last
+        """
+        def more(count):
+            return max_pages is None or count < max_pages
+
+        if not more(0):
+            return
+        pg = self.page
+        count = 1
+        if not prefetch:
+            yield pg
             next_url = pg.links.get('next')
+            while next_url and more(count):
+                log.debug("Requesting page: %s", next_url)
+                pg = self.api_client.get_url(next_url)
+                count += 1
+                next_url = pg.links.get('next')
+                yield pg
+            return
+
+        future = self.__prefetch(pg) if more(count) else None
+        try:
             yield pg
-        return
+            while future is not None:
+                pg = future.result()
+                count += 1
+                future = self.__prefetch(pg) if more(count) else None
+                yield pg
+        finally:
+            # Iteration stopped early (ex: ``limit()``), drop queued request
+            if future is not None:
+                future.cancel()
+
+    def __iter__(self):
+        return self.iter_pages()
+
+    def __prefetch(self, pg):
+        """Starts requesting the page after ``pg``, returning a ``Future``
+        (or ``None`` if ``pg`` is the last page)"""
+        next_url = pg.links.get('next')
+        if not next_url:
+            return None
+        log.debug("Requesting page: %s", next_url)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor.submit(self.api_client.get_url, next_url)
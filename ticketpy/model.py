@@ -1,8 +1,75 @@
 """Models for API objects"""
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
 import re
+import sys
 import ticketpy
 
+#: URL template placeholders the API leaves in some hrefs (ex: {&sort})
+_HREF_TEMPLATE = re.compile(r"{[^}]*}")
+_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+#: Exactly what ``_UTC_FORMAT`` matches, so the fast path below can't
+#: accept anything strptime() would reject (fromisoformat is lenient)
+_UTC_PATTERN = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", re.ASCII)
+#: Read-only stand-in for missing nested objects, so lookups on them
+#: don't allocate a new empty dict each time
+_EMPTY = MappingProxyType({})
+
+try:
+    _from_iso = datetime.fromisoformat
+except AttributeError:  # Python 3.6
+    def _from_iso(ts):
+        return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                        int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+
+
+@lru_cache(maxsize=4096)
+def _parse_utc(ts):
+    """Parses a *YYYY-MM-DDTHH:MM:SSZ* timestamp into a ``datetime``"""
+    # Events often share start times, so results are cached. Parsing
+    # the ISO fields directly is much faster than strptime(), which
+    # still handles (and rejects) anything that doesn't fit.
+    if _UTC_PATTERN.fullmatch(ts):
+        try:
+            return _from_iso(ts[:19])
+        except ValueError:
+            pass
+    return datetime.strptime(ts, _UTC_FORMAT)
+
+
+def _intern(s):
+    """Interns low-cardinality string values (statuses, state codes,
+    genre names...) so repeated values share one string"""
+    return sys.intern(s) if type(s) is str else s
+
+
+def _raw_json(json_obj):
+    """Value for a model's ``json`` attribute (``None`` unless the client
+    is set to keep raw JSON)"""
+    return json_obj if ticketpy.ApiClient.keep_raw_json else None
+
+
+def _shared(cls, json_obj, cache):
+    """Returns ``cls.from_json(json_obj)``, reusing the instance already
+    built for the same ID if ``cache`` (a dict shared across one page)
+    has one"""
+    obj_id = json_obj.get('id') if cache is not None else None
+    if obj_id is None:
+        return cls.from_json(json_obj)
+    key = (cls, obj_id)
+    obj = cache.get(key)
+    if obj is None:
+        obj = cache[key] = cls.from_json(json_obj)
+    return obj
+
+
+def _strip_template(href):
+    """Removes URL template placeholders from an href"""
+    # Most hrefs have none, so skip the regex unless there's a '{'
+    return _HREF_TEMPLATE.sub("", href) if '{' in href else href
+
 
 def _assign_links(obj, json_obj, base_url=None):
     """Assigns ``links`` attribute to an object from JSON"""
@@ -13,20 +80,18 @@ def _assign_links(obj, json_obj, base_url=None):
     if not json_links:
         obj.links = {}
     else:
-        obj_links = {}
-        for k, v in json_links.items():
-            if 'href' in v:
-                href = re.sub("({.+})", "", v['href'])
-                if base_url:
-                    href = "{}{}".format(base_url, href)
-                obj_links[k] = href
-            else:
-                obj_links[k] = v
-        obj.links = obj_links
+        prefix = base_url or ''
+        obj.links = {
+            k: prefix + _strip_template(v['href']) if 'href' in v else v
+            for k, v in json_links.items()
+        }
 
 
 class Page(list):
     """API response page"""
+    __slots__ = ('number', 'size', 'total_elements', 'total_pages', 'json',
+                 'links')
+
     def __init__(self, number=None, size=None, total_elements=None,
                  total_pages=None):
         super().__init__([])
@@ -38,8 +103,8 @@ class Page(list):
     @staticmethod
     def from_json(json_obj):
         """Instantiate and return a Page(list)"""
-        pg = Page()
-        pg.json = json_obj
+        pg = Page.__new__(Page)
+        pg.json = _raw_json(json_obj)
         _assign_links(pg, json_obj, ticketpy.ApiClient.root_url)
         pg.number = json_obj['page']['number']
         pg.size = json_obj['page']['size']
@@ -50,25 +115,22 @@ class Page(list):
         if not embedded:
             return pg
 
-        object_models = {
-            'events': Event,
-            'venues': Venue,
-            'attractions': Attraction,
-            'classifications': Classification
-        }
+        # Items on a page repeat the same few segments/genres/types, so they
+        # share instances through this cache
+        cache = {}
         for k, v in embedded.items():
-            if k in object_models:
-                obj_type = object_models[k]
-                pg += [obj_type.from_json(obj) for obj in v]
+            obj_type = _OBJECT_MODELS.get(k)
+            if obj_type is not None:
+                pg.extend(map(obj_type.from_json, v, repeat(cache)))
 
         return pg
 
     def __str__(self):
         return (
-            "Page {number}/{total_pages}, "
-            "Size: {size}, "
-            "Total elements: {total_elements}"
-        ).format(**self.__dict__)
+            f"Page {self.number}/{self.total_pages}, "
+            f"Size: {self.size}, "
+            f"Total elements: {self.total_elements}"
+        )
 
 
 class Event:
@@ -117,6 +179,9 @@ class Event:
             }
         }
     """
+    __slots__ = ('id', 'name', 'local_start_date', 'local_start_time',
+                 'status', 'classifications', 'price_ranges', 'venues',
+                 'links', 'json', '__utc_datetime')
 
     def __init__(self, event_id=None, name=None, start_date=None,
                  start_time=None, status=None, price_ranges=None,
@@ -148,58 +213,55 @@ class Event:
         if not utc_datetime:
             self.__utc_datetime = None
         else:
-            ts_format = "%Y-%m-%dT%H:%M:%SZ"
-            self.__utc_datetime = datetime.strptime(utc_datetime, ts_format)
+            self.__utc_datetime = _parse_utc(utc_datetime)
 
     @staticmethod
-    def from_json(json_event):
-        """Creates an ``Event`` from API's JSON response"""
-        e = Event()
-        e.json = json_event
-        e.id = json_event.get('id')
-        e.name = json_event.get('name')
-
-        dates = json_event.get('dates', {})
-        start_dates = dates.get('start', {})
+    def from_json(json_event, cache=None):
+        """Creates an ``Event`` from API's JSON response
+
+        :param cache: Dict shared by items on the same page, so repeated
+            segments/genres/subgenres/types/subtypes reuse one instance
+        """
+        e = Event.__new__(Event)
+        g = json_event.get
+        e.json = _raw_json(json_event)
+        e.id = g('id')
+        e.name = g('name')
+
+        dates = g('dates') or _EMPTY
+        start_dates = dates.get('start') or _EMPTY
         e.local_start_date = start_dates.get('localDate')
         e.local_start_time = start_dates.get('localTime')
         e.utc_datetime = start_dates.get('dateTime')
 
-        status = dates.get('status', {})
-        e.status = status.get('code')
-
-        if 'classifications' in json_event:
-            e.classifications = [EventClassification.from_json(cl)
-                                 for cl in json_event['classifications']]
-
-        price_ranges = []
-        if 'priceRanges' in json_event:
-            for pr in json_event['priceRanges']:
-                pr_dict = {}
-                if 'min' in pr:
-                    pr_dict['min'] = pr['min']
-                if 'max' in pr:
-                    pr_dict['max'] = pr['max']
-                price_ranges.append(pr_dict)
-        e.price_ranges = price_ranges
-
-        venues = []
-        if 'venues' in json_event.get('_embedded', {}):
-            for v in json_event['_embedded']['venues']:
-                venues.append(Venue.from_json(v))
-        e.venues = venues
+        status = dates.get('status') or _EMPTY
+        e.status = _intern(status.get('code'))
+
+        classifications = g('classifications')
+        e.classifications = None
+        if classifications is not None:
+            e.classifications = list(map(EventClassification.from_json,
+                                         classifications, repeat(cache)))
+
+        e.price_ranges = [
+            {k: pr[k] for k in ('min', 'max') if k in pr}
+            for pr in g('priceRanges', ())
+        ]
+
+        embedded = g('_embedded')
+        venues = embedded.get('venues', ()) if embedded else ()
+        e.venues = list(map(Venue.from_json, venues))
         _assign_links(e, json_event)
         return e
 
     def __str__(self):
-        tmpl = ("Event:            {name}\n"
-                "Venues:           {venues}\n"
-                "Start date:       {local_start_date}\n"
-                "Start time:       {local_start_time}\n"
-                "Price ranges:     {price_ranges}\n"
-                "Status:           {status}\n"
-                "Classifications:  {classifications!s}\n")
-        return tmpl.format(**self.__dict__)
+        return (f"Event:            {self.name}\n"
+                f"Venues:           {self.venues}\n"
+                f"Start date:       {self.local_start_date}\n"
+                f"Start time:       {self.local_start_time}\n"
+                f"Price ranges:     {self.price_ranges}\n"
+                f"Status:           {self.status}\n"
+                f"Classifications:  {self.classifications!s}\n")
 
 
 class Venue:
@@ -248,6 +310,12 @@ class Venue:
 
     
     """
+    __slots__ = ('name', 'id', 'address', 'postal_code', 'city', 'state_code',
+                 'latitude', 'longitude', 'timezone', 'url', 'box_office_info',
+                 'dmas', 'markets', 'general_info', 'social', 'images',
+                 'parking_detail', 'accessible_seating_detail', 'links',
+                 'json')
+
     def __init__(self, name=None, address=None, city=None, state_code=None,
                  postal_code=None, latitude=None, longitude=None,
                  markets=None, url=None, box_office_info=None,
@@ -290,45 +358,51 @@ class Venue:
         }
 
     @staticmethod
-    def from_json(json_venue):
-        """Returns a ``Venue`` object from JSON"""
-        v = Venue()
-        v.json = json_venue
-        v.id = json_venue.get('id')
-        v.name = json_venue.get('name')
-        v.url = json_venue.get('url')
-        v.postal_code = json_venue.get('postalCode')
-        v.general_info = json_venue.get('generalInfo')
-        v.box_office_info = json_venue.get('boxOfficeInfo')
-        v.dmas = json_venue.get('dmas')
-        v.social = json_venue.get('social')
-        v.timezone = json_venue.get('timezone')
-        v.images = json_venue.get('images')
-        v.parking_detail = json_venue.get('parkingDetail')
-        v.accessible_seating_detail = json_venue.get('accessibleSeatingDetail')
-
-        if 'markets' in json_venue:
-            v.markets = [m.get('id') for m in json_venue.get('markets')]
-        if 'city' in json_venue:
-            v.city = json_venue['city'].get('name')
-        if 'address' in json_venue:
-            v.address = json_venue['address'].get('line1')
-        if 'location' in json_venue:
-            v.latitude = json_venue['location'].get('latitude')
-            v.longitude = json_venue['location'].get('longitude')
-        if 'state' in json_venue:
-            v.state_code = json_venue['state'].get('stateCode')
+    def from_json(json_venue, cache=None):
+        """Returns a ``Venue`` object from JSON (``cache`` is unused, it's
+        accepted so ``Page`` can build every item type the same way)"""
+        v = Venue.__new__(Venue)
+        g = json_venue.get
+        v.json = _raw_json(json_venue)
+        v.id = g('id')
+        v.name = g('name')
+        v.url = g('url')
+        v.postal_code = g('postalCode')
+        v.general_info = g('generalInfo')
+        v.box_office_info = g('boxOfficeInfo')
+        v.dmas = g('dmas')
+        v.social = g('social')
+        v.timezone = _intern(g('timezone'))
+        v.images = g('images')
+        v.parking_detail = g('parkingDetail')
+        v.accessible_seating_detail = g('accessibleSeatingDetail')
+
+        markets = g('markets')
+        v.markets = (None if markets is None
+                     else [m.get('id') for m in markets])
+        city = g('city')
+        v.city = city.get('name') if city else None
+        address = g('address')
+        v.address = address.get('line1') if address else None
+        location = g('location') or _EMPTY
+        v.latitude = location.get('latitude')
+        v.longitude = location.get('longitude')
+        state = g('state')
+        v.state_code = _intern(state.get('stateCode')) if state else None
 
         _assign_links(v, json_venue)
         return v
 
     def __str__(self):
-        return ("{name} at {address} in "
-                "{city} {state_code}").format(**self.__dict__)
+        return (f"{self.name} at {self.address} in "
+                f"{self.city} {self.state_code}")
 
 
 class Attraction:
     """Attraction"""
+    __slots__ = ('id', 'name', 'url', 'classifications', 'images', 'test',
+                 'links', 'json')
+
     def __init__(self, attraction_id=None, attraction_name=None, url=None,
                  classifications=None, images=None, test=None, links=None):
         self.id = attraction_id
@@ -340,19 +414,26 @@ class Attraction:
         self.links = links
 
     @staticmethod
-    def from_json(json_obj):
-        """Convert JSON object to ``Attraction`` object"""
-        att = Attraction()
-        att.json = json_obj
-        att.id = json_obj.get('id')
-        att.name = json_obj.get('name')
-        att.url = json_obj.get('url')
-        att.test = json_obj.get('test')
-        att.images = json_obj.get('images')
-        classifications = json_obj.get('classifications')
-        att.classifications = [
-            Classification.from_json(cl) for cl in classifications
-        ]
+    def from_json(json_obj, cache=None):
+        """Convert JSON object to ``Attraction`` object
+
+        :param cache: Dict shared by items on the same page, so repeated
+            segments reuse one instance
+        """
+        att = Attraction.__new__(Attraction)
+        g = json_obj.get
+        att.json = _raw_json(json_obj)
+        att.id = g('id')
+        att.name = g('name')
+        att.url = g('url')
+        att.test = g('test')
+        att.images = g('images')
+        classifications = g('classifications')
+        att.classifications = (
+            list(map(Classification.from_json, classifications,
+                     repeat(cache)))
+            if classifications else []
+        )
 
         _assign_links(att, json_obj)
         return att
@@ -366,6 +447,8 @@ class Classification:
     
     For the structure returned by ``EventSearch``, see ``EventClassification``
     """
+    __slots__ = ('segment', 'type', 'subtype', 'primary', 'links', 'json')
+
     def __init__(self, segment=None, classification_type=None, subtype=None,
                  primary=None, links=None):
         self.segment = segment
@@ -375,22 +458,27 @@ class Classification:
         self.links = links
 
     @staticmethod
-    def from_json(json_obj):
-        """Create/return ``Classification`` object from JSON"""
-        cl = Classification()
-        cl.json = json_obj
+    def from_json(json_obj, cache=None):
+        """Create/return ``Classification`` object from JSON
+
+        :param cache: Dict shared by items on the same page, so repeated
+            segments/types/subtypes reuse one instance
+        """
+        cl = Classification.__new__(Classification)
+        cl.json = _raw_json(json_obj)
         cl.primary = json_obj.get('primary')
+        cl.segment = cl.type = cl.subtype = None
 
         if 'segment' in json_obj:
-            cl.segment = Segment.from_json(json_obj['segment'])
+            cl.segment = _shared(Segment, json_obj['segment'], cache)
 
         if 'type' in json_obj:
-            cl_t = json_obj['type']
-            cl.type = ClassificationType(cl_t['id'], cl_t['name'])
+            cl.type = _shared_type(ClassificationType, json_obj['type'],
+                                   cache)
 
         if 'subType' in json_obj:
-            cl_st = json_obj['subType']
-            cl.subtype = ClassificationSubType(cl_st['id'], cl_st['name'])
+            cl.subtype = _shared_type(ClassificationSubType,
+                                      json_obj['subType'], cache)
 
         _assign_links(cl, json_obj)
         return cl
@@ -404,6 +492,9 @@ class EventClassification:
 
     See ``Classification()`` for results from classification searches
     """
+    __slots__ = ('genre', 'subgenre', 'segment', 'type', 'subtype', 'primary',
+                 'links', 'json')
+
     def __init__(self, genre=None, subgenre=None, segment=None,
                  classification_type=None, classification_subtype=None,
                  primary=None, links=None):
@@ -416,44 +507,52 @@ class EventClassification:
         self.links = links
 
     @staticmethod
-    def from_json(json_obj):
-        """Create/return ``EventClassification`` object from JSON"""
-        ec = EventClassification()
-        ec.json = json_obj
-        ec.primary = json_obj.get('primary')
-
-        segment = json_obj.get('segment')
+    def from_json(json_obj, cache=None):
+        """Create/return ``EventClassification`` object from JSON
+
+        :param cache: Dict shared by items on the same page, so repeated
+            segments/genres/subgenres/types/subtypes reuse one instance
+        """
+        ec = EventClassification.__new__(EventClassification)
+        g = json_obj.get
+        ec.json = _raw_json(json_obj)
+        ec.primary = g('primary')
+        ec.segment = ec.genre = ec.subgenre = ec.type = ec.subtype = None
+
+        segment = g('segment')
         if segment:
-            ec.segment = Segment.from_json(segment)
+            ec.segment = _shared(Segment, segment, cache)
 
-        genre = json_obj.get('genre')
+        genre = g('genre')
         if genre:
-            ec.genre = Genre.from_json(genre)
+            ec.genre = _shared(Genre, genre, cache)
 
-        subgenre = json_obj.get('subGenre')
+        subgenre = g('subGenre')
         if subgenre:
-            ec.subgenre = SubGenre.from_json(subgenre)
+            ec.subgenre = _shared(SubGenre, subgenre, cache)
 
-        cl_t = json_obj.get('type')
+        cl_t = g('type')
         if cl_t:
-            ec.type = ClassificationType(cl_t['id'], cl_t['name'])
+            ec.type = _shared_type(ClassificationType, cl_t, cache)
 
-        cl_st = json_obj.get('subType')
+        cl_st = g('subType')
         if cl_st:
-            ec.subtype = ClassificationSubType(cl_st['id'], cl_st['name'])
+            ec.subtype = _shared_type(ClassificationSubType, cl_st, cache)
 
         _assign_links(ec, json_obj)
         return ec
 
     def __str__(self):
-        return ("Segment: {segment} / "
-                "Genre: {genre} / "
-                "Subgenre: {subgenre} / "
-                "Type: {type} / "
-                "Subtype: {subtype}").format(**self.__dict__)
+        return (f"Segment: {self.segment} / "
+                f"Genre: {self.genre} / "
+                f"Subgenre: {self.subgenre} / "
+                f"Type: {self.type} / "
+                f"Subtype: {self.subtype}")
 
 
 class ClassificationType:
+    __slots__ = ('id', 'name', 'subtypes')
+
     def __init__(self, type_id=None, type_name=None, subtypes=None):
         self.id = type_id
         self.name = type_name
@@ -464,6 +563,8 @@ class ClassificationType:
 
 
 class ClassificationSubType:
+    __slots__ = ('id', 'name')
+
     def __init__(self, type_id=None, type_name=None):
         self.id = type_id
         self.name = type_name
@@ -472,7 +573,25 @@ class ClassificationSubType:
         return self.name if self.name is not None else 'Unknown'
 
 
+def _shared_type(cls, json_obj, cache):
+    """Returns a ``cls`` (``ClassificationType``/``ClassificationSubType``)
+    for ``json_obj``, reusing the instance already built for the same ID
+    and name if ``cache`` (a dict shared across one page) has one"""
+    # Types/subtypes come from a small fixed vocabulary and repeat across
+    # nearly every item on a page
+    type_id, type_name = json_obj['id'], json_obj['name']
+    if cache is None:
+        return cls(type_id, type_name)
+    key = (cls, type_id, type_name)
+    obj = cache.get(key)
+    if obj is None:
+        obj = cache[key] = cls(type_id, type_name)
+    return obj
+
+
 class Segment:
+    __slots__ = ('id', 'name', 'genres', 'links', 'json')
+
     def __init__(self, segment_id=None, segment_name=None, genres=None,
                  links=None):
         self.id = segment_id
@@ -483,14 +602,15 @@ class Segment:
     @staticmethod
     def from_json(json_obj):
         """Create and return a ``Segment`` from JSON"""
-        seg = Segment()
-        seg.json = json_obj
+        seg = Segment.__new__(Segment)
+        seg.json = _raw_json(json_obj)
         seg.id = json_obj['id']
-        seg.name = json_obj.get('name')
+        seg.name = _intern(json_obj.get('name'))
+        seg.genres = None
 
         if '_embedded' in json_obj:
             genres = json_obj['_embedded']['genres']
-            seg.genres = [Genre.from_json(g) for g in genres]
+            seg.genres = list(map(Genre.from_json, genres))
 
         _assign_links(seg, json_obj)
         return seg
@@ -500,6 +620,8 @@ class Segment:
 
 
 class Genre:
+    __slots__ = ('id', 'name', 'subgenres', 'links', 'json')
+
     def __init__(self, genre_id=None, genre_name=None, subgenres=None,
                  links=None):
         self.id = genre_id
@@ -509,14 +631,15 @@ class Genre:
 
     @staticmethod
     def from_json(json_obj):
-        g = Genre()
-        g.json = json_obj
+        g = Genre.__new__(Genre)
+        g.json = _raw_json(json_obj)
         g.id = json_obj.get('id')
-        g.name = json_obj.get('name')
+        g.name = _intern(json_obj.get('name'))
+        g.subgenres = None
         if '_embedded' in json_obj:
             embedded = json_obj['_embedded']
             subgenres = embedded['subgenres']
-            g.subgenres = [SubGenre.from_json(sg) for sg in subgenres]
+            g.subgenres = list(map(SubGenre.from_json, subgenres))
 
         _assign_links(g, json_obj)
         return g
@@ -526,6 +649,8 @@ class Genre:
 
 
 class SubGenre:
+    __slots__ = ('id', 'name', 'links', 'json')
+
     def __init__(self, subgenre_id=None, subgenre_name=None, links=None):
         self.id = subgenre_id
         self.name = subgenre_name
@@ -533,12 +658,21 @@ class SubGenre:
 
     @staticmethod
     def from_json(json_obj):
-        sg = SubGenre()
-        sg.json = json_obj
+        sg = SubGenre.__new__(SubGenre)
+        sg.json = _raw_json(json_obj)
         sg.id = json_obj['id']
-        sg.name = json_obj['name']
+        sg.name = _intern(json_obj['name'])
         _assign_links(sg, json_obj)
         return sg
 
     def __str__(self):
         return self.name if self.name is not None else 'Unknown'
+
+
+#: Models for each kind of item embedded in a ``Page``
+_OBJECT_MODELS = {
+    'events': Event,
+    'venues': Venue,
+    'attractions': Attraction,
+    'classifications': Classification
+}
@@ -1,5 +1,4 @@
 """Classes to handle API queries/searches"""
-import requests
 from ticketpy.model import Venue, Event, Attraction, Classification
 
 
@@ -87,9 +86,9 @@ class BaseQuery:
 
     def by_id(self, entity_id):
         """Get a specific object by its ID"""
-        get_tmpl = "{}/{}/{}"
-        get_url = get_tmpl.format(self.api_client.url, self.method, entity_id)
-        r = requests.get(get_url, params=self.api_client.api_key)
+        get_url = f"{self.api_client.url}/{self.method}/{entity_id}"
+        r = self.api_client._session.get(get_url,
+                                        params=self.api_client.api_key)
         r_json = self.api_client._handle_response(r)
         return self.model.from_json(r_json)
 
@@ -102,18 +101,11 @@ class BaseQuery:
         :param kwargs: Keyword arguments
         :return: API-friendly parameters
         """
-        # Update search parameters with kwargs
-        kw_map = {}
-        for k, v in kwargs.items():
-            # If arg is API-friendly (ex: stateCode='GA')
-            if k in self.attr_map.keys():
-                kw_map[self.attr_map[k]] = v
-            elif k in self.attr_map.values():
-                kw_map[k] = v
-            else:
-                kw_map[k] = v
-
-        return {k: v for (k, v) in kw_map.items() if v is not None}
+        # Map our parameter names to the API's (ex: state_code -> stateCode),
+        # passing through names that are already API-friendly (stateCode)
+        attr_map = self.attr_map
+        return {attr_map.get(k, k): v
+                for (k, v) in kwargs.items() if v is not None}
 
 
 class AttractionQuery(BaseQuery):
@@ -284,7 +276,7 @@ class EventQuery(BaseQuery):
         latitude = str(latitude)
         longitude = str(longitude)
         radius = str(radius)
-        latlong = "{lat},{long}".format(lat=latitude, long=longitude)
+        latlong = f"{latitude},{longitude}"
         return self.find(
             latlong=latlong,
             radius=radius,
@@ -1,8 +1,18 @@
-from unittest import TestCase, skip
+from unittest import TestCase, skip, mock
 from configparser import ConfigParser
+import asyncio
+import json
+import time
 import os
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Event, Lock, Thread
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+from requests import exceptions
 import ticketpy
-from ticketpy.client import ApiException
+from ticketpy.client import ApiException, _ResponseCache, _yes_no_only
+from ticketpy.model import Page, _parse_utc
+from datetime import datetime
 from math import radians, cos, sin, asin, sqrt
 
 
@@ -37,6 +47,53 @@ def get_client():
     return ticketpy.ApiClient(api_key)
 
 
+class StubResponse:
+    """Stands in for ``requests.Response`` in offline tests"""
+    def __init__(self, status_code=200, content=b'{}', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode()
+        self.headers = headers or {}
+        self.url = 'stub'
+
+
+def page_json(number=0, total_pages=1, size=1):
+    """Returns the body of an events page, as the API would"""
+    link = '/discovery/v2/events.json?page={}&size={}{{&sort}}'
+    links = {'self': {'href': link.format(number, size)}}
+    if number + 1 < total_pages:
+        links['next'] = {'href': link.format(number + 1, size)}
+    return json.dumps({
+        '_embedded': {'events': [
+            {'id': 'E{}'.format(number * size + i)} for i in range(size)
+        ]},
+        '_links': links,
+        'page': {'number': number, 'size': size,
+                 'totalPages': total_pages,
+                 'totalElements': total_pages * size}
+    }).encode()
+
+
+def stub_client(total_pages=1, respond=None, **kwargs):
+    """Returns an ``ApiClient`` that serves pages from ``page_json()``
+    (or ``respond(url, params)``) instead of the API, along with the list
+    of ``(url, params)`` requests it gets"""
+    requests = []
+    client = ticketpy.ApiClient('random_key', **kwargs)
+
+    def get(url, params=None, **_):
+        url, _, query = url.partition('?')
+        params = dict(parse_qsl(query), **(params or {}))
+        requests.append((url, params))
+        if respond is not None:
+            return respond(url, params)
+        number = int(params.get('page', 0))
+        return StubResponse(content=page_json(number, total_pages))
+
+    client._session.get = get
+    return client, requests
+
+
 class TestApiClient(TestCase):
     def setUp(self):
         self.api_client = get_client()
@@ -332,3 +389,347 @@ class TestPagedResponse(TestCase):
         self.assertListEqual(iter_all, iter_manual)
 
 
+class TestApiClientOffline(TestCase):
+    """``ApiClient`` tests that don't need an API key"""
+    def test_context_manager(self):
+        with ticketpy.ApiClient('random_key') as tmp_client:
+            self.assertIsInstance(tmp_client, ticketpy.ApiClient)
+            adapter = tmp_client._session.get_adapter(tmp_client.url)
+            self.assertEqual(3, adapter.max_retries.total)
+
+    def test_retries_exhausted(self):
+        # After the last retry, a 429 should still raise ApiException
+        # (with the API's fault details), not requests' RetryError
+        class Handler(BaseHTTPRequestHandler):
+            hits = 0
+
+            def do_GET(self):
+                Handler.hits += 1
+                body = b'{"fault": {"faultstring": "Rate limit quota ' \
+                       b'violation", "detail": {"errorcode": "x"}}}'
+                self.send_response(429)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with ticketpy.ApiClient('random_key') as tmp_client:
+                session = tmp_client._session
+                adapter = session.get_adapter(tmp_client.url)
+                adapter.max_retries = adapter.max_retries.new(
+                    backoff_factor=0
+                )
+                session.mount('http://', adapter)
+                link = 'http://127.0.0.1:{}/events.json'.format(
+                    server.server_port
+                )
+                with self.assertRaises(ApiException) as cm:
+                    tmp_client.get_url(link)
+            self.assertEqual(429, cm.exception.args[0])
+            self.assertEqual(4, Handler.hits)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+    def test_yes_no_only(self):
+        yno = _yes_no_only
+        self.assertEqual(yno('true'), 'yes')
+        self.assertEqual(yno('True'), 'yes')
+        self.assertEqual(yno(True), 'yes')
+        self.assertEqual(yno('false'), 'no')
+        self.assertEqual(yno('False'), 'no')
+        self.assertEqual(yno(False), 'no')
+        self.assertEqual(yno('ONLY'), 'only')
+
+        # 1/0 hash like True/False, but are passed through as numbers
+        self.assertEqual(yno(1), '1')
+        self.assertEqual(yno(0), '0')
+        self.assertEqual(yno(['a']), "['a']")
+
+
+class TestResponseCache(TestCase):
+    def test_api_key_change(self):
+        # Responses cached under the old key mustn't be served for the new
+        client, requests = stub_client()
+        link = client.url + '/events.json?page=1'
+        client.events.find().one()
+        client.events.find().one()
+        client.get_url(link)
+        client.get_url(link)
+        self.assertEqual(2, len(requests))
+        client.api_key = 'other_key'
+        client.events.find().one()
+        client.get_url(link)
+        self.assertEqual(4, len(requests))
+        self.assertEqual('other_key', requests[2][1]['apikey'])
+        self.assertEqual('other_key', requests[3][1]['apikey'])
+
+    def test_expiry(self):
+        cache = _ResponseCache(4, ttl=30)
+        bodies = iter([b'first', b'second'])
+
+        def request():
+            return next(bodies), True
+
+        with mock.patch('ticketpy.client.time.monotonic', return_value=0):
+            self.assertEqual(b'first', cache.fetch('k', request))
+        with mock.patch('ticketpy.client.time.monotonic', return_value=29):
+            self.assertEqual(b'first', cache.fetch('k', request))
+        with mock.patch('ticketpy.client.time.monotonic', return_value=31):
+            self.assertEqual(b'second', cache.fetch('k', request))
+
+    def test_eviction(self):
+        # Least recently used entry goes first once maxsize is exceeded
+        cache = _ResponseCache(2)
+        calls = []
+
+        def request_for(key):
+            def request():
+                calls.append(key)
+                return key.encode(), True
+            return request
+
+        for key in ('a', 'b', 'a', 'c', 'a', 'b'):
+            cache.fetch(key, request_for(key))
+        self.assertEqual(['a', 'b', 'c', 'b'], calls)
+
+    def test_no_store(self):
+        no_store = StubResponse(content=page_json(),
+                                headers={'Cache-Control': 'no-store'})
+        client, requests = stub_client(respond=lambda url, params: no_store)
+        client.events.find().one()
+        client.events.find().one()
+        self.assertEqual(2, len(requests))
+
+    def test_cache_stats(self):
+        client, requests = stub_client(total_pages=2)
+        self.assertEqual({'hits': 0, 'misses': 0}, client.cache_stats())
+        list(client.events.find(size=1))
+        list(client.events.find(size=1))
+        # First pass misses on the search and page 2, second pass hits
+        self.assertEqual({'hits': 2, 'misses': 2}, client.cache_stats())
+        self.assertEqual(2, len(requests))
+        client.clear_cache()
+        client.events.find(size=1).one()
+        self.assertEqual(3, len(requests))
+
+    def test_stale_fallback(self):
+        cache = _ResponseCache(4, ttl=30)
+        with mock.patch('ticketpy.client.time.monotonic', return_value=0):
+            cache.fetch('k', lambda: (b'stale', True))
+
+        def fail(status_code):
+            def request():
+                raise ApiException(status_code, 'error')
+            return request
+
+        def raise_error(error):
+            def request():
+                raise error
+            return request
+
+        with mock.patch('ticketpy.client.time.monotonic', return_value=60):
+            # Transient errors serve the expired body when allowed...
+            self.assertEqual(b'stale',
+                             cache.fetch('k', fail(503), fallback=True))
+            self.assertEqual(b'stale',
+                             cache.fetch('k', fail(429), fallback=True))
+            # ...but not without fallback, or for other errors
+            self.assertRaises(ApiException, cache.fetch, 'k', fail(503))
+            self.assertRaises(ApiException, cache.fetch, 'k', fail(400),
+                              fallback=True)
+            self.assertRaises(ApiException, cache.fetch, 'missing',
+                              fail(503), fallback=True)
+
+            # Connection failures and timeouts are transient too, other
+            # request errors aren't
+            for error in (exceptions.ConnectionError(), exceptions.Timeout()):
+                self.assertEqual(b'stale', cache.fetch(
+                    'k', raise_error(error), fallback=True))
+            for error in (exceptions.InvalidURL(),
+                          exceptions.TooManyRedirects()):
+                self.assertRaises(type(error), cache.fetch, 'k',
+                                  raise_error(error), fallback=True)
+
+    def test_client_stale_fallback(self):
+        responses = [StubResponse(content=page_json()),
+                     StubResponse(503, b'{"fault": {"faultstring": "down", '
+                                       b'"detail": {"errorcode": "x"}}}')]
+        client, requests = stub_client(
+            respond=lambda url, params: responses[len(requests) - 1],
+            cache_ttl=30, cache_fallback=True
+        )
+        with mock.patch('ticketpy.client.time.monotonic', return_value=0):
+            first = client.events.find().one()
+        with mock.patch('ticketpy.client.time.monotonic', return_value=60):
+            stale = client.events.find().one()
+        self.assertEqual(2, len(requests))
+        self.assertEqual([e.id for e in first], [e.id for e in stale])
+
+
+class TestPaging(TestCase):
+    """Paging against a stubbed session (no API requests)"""
+    def finish(self, response):
+        # Wait for any background prefetch so every request is counted
+        if response._executor is not None:
+            response._executor.shutdown(wait=True)
+
+    def test_limit_prefetch(self):
+        # limit() shouldn't request the page after its last one
+        for max_pages in (1, 2, 3):
+            client, requests = stub_client(total_pages=5)
+            response = client.events.find(size=1)
+            items = response.limit(max_pages)
+            self.finish(response)
+            self.assertEqual(max_pages, len(items))
+            self.assertEqual(max_pages, len(requests))
+
+    def test_iter_pages_max_pages(self):
+        client, requests = stub_client(total_pages=5)
+        response = client.events.find(size=1)
+        pages = list(response.iter_pages(prefetch=False, max_pages=2))
+        self.assertEqual([0, 1], [pg.number for pg in pages])
+        self.assertEqual(2, len(requests))
+        self.assertEqual([], list(response.iter_pages(max_pages=0)))
+
+    def test_one(self):
+        client, _ = stub_client()
+        response = client.events.find()
+        items = response.one()
+        self.assertIs(list, type(items))
+        self.assertEqual(response.page, items)
+        items.clear()
+        self.assertEqual(1, len(response.page))
+        self.finish(response)
+
+    def test_aiter_pages(self):
+        client, _ = stub_client(total_pages=6)
+        response = client.events.find(size=1)
+        get_url = ticketpy.ApiClient.get_url
+        lock = Lock()
+        in_flight = [0, 0]  # current, max
+
+        def stub_get_url(api_client, link):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            try:
+                time.sleep(0.01)
+                return get_url(api_client, link)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        async def consume():
+            return [pg.number
+                    async for pg in response.aiter_pages(concurrency=2)]
+
+        with mock.patch.object(ticketpy.ApiClient, 'get_url', stub_get_url):
+            self.assertEqual(list(range(6)), asyncio.run(consume()))
+        self.assertLessEqual(in_flight[1], 2)
+        self.finish(response)
+
+    def test_aiter_pages_stop_early(self):
+        # Stopping early cancels requests still pending and doesn't
+        # request anything past the window already in flight
+        client, _ = stub_client(total_pages=10)
+        response = client.events.find(size=1)
+        get_url = ticketpy.ApiClient.get_url
+        release = Event()
+        requested = []
+        shutdown = []
+
+        def stub_get_url(api_client, link):
+            pg = get_url(api_client, link)
+            requested.append(pg.number)
+            if pg.number >= 3:
+                release.wait(5)
+            return pg
+
+        class Executor(ThreadPoolExecutor):
+            # A single worker, so the last page in the window is still
+            # queued (and can be cancelled) when the consumer stops
+            def __init__(self, max_workers=None):
+                super().__init__(max_workers=1)
+
+            def shutdown(self, *args, **kwargs):
+                shutdown.append(self)
+                super().shutdown(*args, **kwargs)
+
+        async def consume():
+            pages = response.aiter_pages(concurrency=2)
+            numbers = [(await pages.__anext__()).number for _ in range(3)]
+            await pages.aclose()
+            return numbers
+
+        with mock.patch.object(ticketpy.ApiClient, 'get_url', stub_get_url), \
+                mock.patch('ticketpy.client.ThreadPoolExecutor', Executor):
+            self.assertEqual([0, 1, 2], asyncio.run(consume()))
+        self.assertEqual(1, len(shutdown))
+        release.set()
+        shutdown[0].shutdown(wait=True)
+        self.assertEqual([1, 2, 3], requested)
+        self.finish(response)
+
+    def test_all_paging_depth(self):
+        # all() shouldn't request pages past the API's depth limit
+        # (page * size < 1000), which would only return errors
+        def respond(url, params):
+            size = int(params['size'])
+            number = int(params.get('page', 0))
+            return StubResponse(content=page_json(number, 2000, size))
+
+        # The last page allowed is 999 for size 1, and 142 for size 7
+        # (142 * 7 = 994), even though 1000 isn't a multiple of 7
+        for size, last_page in ((1, 999), (7, 142)):
+            with self.subTest(size=size):
+                client, requests = stub_client(respond=respond)
+                items = client.events.find(size=size).all()
+                self.assertEqual(last_page + 1, len(requests))
+                self.assertEqual(last_page, max(int(p.get('page', 0))
+                                                for _, p in requests))
+                self.assertEqual((last_page + 1) * size, len(items))
+
+
+class TestModel(TestCase):
+    def test_parse_utc(self):
+        self.assertEqual(datetime(2017, 5, 19, 23, 0, 0),
+                         _parse_utc('2017-05-19T23:00:00Z'))
+        # Only the exact YYYY-MM-DDTHH:MM:SSZ format is accepted, even
+        # where fromisoformat() would be more lenient
+        for ts in ('2017-05-05T120000.0Z', '2017-05-05T12:00+00Z',
+                   '2017-13-19T23:00:00Z', '2017-05-19 23:00:00',
+                   '2017-05-19T23:00:00', ''):
+            with self.subTest(ts=ts):
+                self.assertRaises(ValueError, _parse_utc, ts)
+
+    def test_parse_utc_cached(self):
+        ts = '2018-01-02T03:04:05Z'
+        hits = _parse_utc.cache_info().hits
+        first = _parse_utc(ts)
+        self.assertIs(first, _parse_utc(ts))
+        self.assertEqual(hits + 1, _parse_utc.cache_info().hits)
+
+    def test_shared_classification_types(self):
+        classification = {'type': {'id': 'KZ', 'name': 'Undefined'},
+                          'subType': {'id': 'KZ', 'name': 'Undefined'}}
+        body = json.loads(page_json(size=2))
+        for event in body['_embedded']['events']:
+            event['classifications'] = [dict(classification)]
+
+        pg = Page.from_json(body)
+        first, second = (e.classifications[0] for e in pg)
+        self.assertIs(first.type, second.type)
+        self.assertIs(first.subtype, second.subtype)
+
+        # Instances are only shared within a page
+        first.type.name = 'mutated'
+        other = Page.from_json(body)[0].classifications[0]
+        self.assertIsNot(first.type, other.type)
+        self.assertEqual('Undefined', other.type.name)